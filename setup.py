@@ -1,21 +1,16 @@
-from setuptools import find_packages, setup
-
-
-def find_required():
-    with open("requirements.txt") as f:
-        return f.read().splitlines()
+from pathlib import Path
 
+from setuptools import find_packages, setup
 
-def find_dev_required():
-    with open("requirements-dev.txt") as f:
-        return f.read().splitlines()
-
+required = Path("requirements.txt").read_text().splitlines()
+dev_required = Path("requirements-dev.txt").read_text().splitlines()
+long_description = Path("README.md").read_text()
 
 setup(
     name="vedro-dev",
     version="0.2.1",
     description="Dev mode for Vedro",
-    long_description=open("README.md").read(),
+    long_description=long_description,
     long_description_content_type="text/markdown",
     author="Nikita Tsvetkov",
     author_email="tsv1@fastmail.com",
@@ -24,8 +19,8 @@ setup(
     license="Apache-2.0",
     packages=find_packages(exclude=["tests", "tests.*"]),
     package_data={"vedro": ["py.typed"]},
-    install_requires=find_required(),
-    tests_require=find_dev_required(),
+    install_requires=required,
+    tests_require=dev_required,
     classifiers=[
         "License :: OSI Approved :: Apache Software License",
         "Programming Language :: Python :: 3.8",
@@ -1,11 +1,10 @@
 import asyncio
-from argparse import ArgumentParser
-
-from aiohttp import ClientConnectorError, ClientSession
-from aiohttp.http_websocket import WSMessage
 
 
 async def connect(host: str, port: int) -> None:
+    from aiohttp import ClientSession
+    from aiohttp.http_websocket import WSMessage
+
     async with ClientSession() as session:
         async with session.ws_connect(f"ws://{host}:{port}/ws") as ws:
             async for msg in ws:
@@ -14,11 +13,15 @@ async def connect(host: str, port: int) -> None:
 
 
 async def main() -> None:
+    from argparse import ArgumentParser
+
     parser = ArgumentParser()
     parser.add_argument("--host", default="localhost")
     parser.add_argument("--port", default=8484, type=int)
 
     args = parser.parse_args()
+
+    from aiohttp import ClientConnectorError
     try:
         await connect(args.host, args.port)
     except ClientConnectorError as e:
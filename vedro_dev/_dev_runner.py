@@ -47,8 +47,9 @@ class DevScenarioRunner(ScenarioRunner):
 
     async def run_step(self, step: VirtualStep, ref: Scenario) -> StepResult:
         step_result = StepResult(step)
+        fire = self._dispatcher.fire
 
-        await self._dispatcher.fire(StepRunEvent(step_result))
+        await fire(StepRunEvent(step_result))
         step_result.set_started_at(time())
         try:
             if step.is_coro():
@@ -59,13 +60,13 @@ class DevScenarioRunner(ScenarioRunner):
             step_result.set_ended_at(time()).mark_failed()
 
             exc_info = ExcInfo(*sys.exc_info())
-            await self._dispatcher.fire(ExceptionRaisedEvent(exc_info))
+            await fire(ExceptionRaisedEvent(exc_info))
             step_result.set_exc_info(exc_info)
 
-            await self._dispatcher.fire(StepFailedEvent(step_result))
+            await fire(StepFailedEvent(step_result))
         else:
             step_result.set_ended_at(time()).mark_passed()
-            await self._dispatcher.fire(StepPassedEvent(step_result))
+            await fire(StepPassedEvent(step_result))
 
         return step_result
 
@@ -83,20 +84,21 @@ class DevScenarioRunner(ScenarioRunner):
         ref = scenario()
         scenario_result.set_scope(ref.__dict__)
 
+        failed = False
         async for step in self._step_scheduler(scenario):
             step_result = await self.run_step(step, ref)
             scenario_result.add_step_result(step_result)
+            if step_result.is_failed():
+                failed = True
 
         scenario_result.set_ended_at(time())
 
-        for step_result in scenario_result.step_results:
-            if step_result.is_failed():
-                scenario_result.mark_failed()
-                await self._dispatcher.fire(ScenarioFailedEvent(scenario_result))
-                return scenario_result
-
-        scenario_result.mark_passed()
-        await self._dispatcher.fire(ScenarioPassedEvent(scenario_result))
+        if failed:
+            scenario_result.mark_failed()
+            await self._dispatcher.fire(ScenarioFailedEvent(scenario_result))
+        else:
+            scenario_result.mark_passed()
+            await self._dispatcher.fire(ScenarioPassedEvent(scenario_result))
         return scenario_result
 
     async def _run_scenarios(self, scheduler: ScenarioScheduler, report: Report) -> None:
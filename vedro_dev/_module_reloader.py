@@ -1,28 +1,50 @@
 import importlib
+import os
 import sys
-from pathlib import Path
-from typing import Set, Union
+from typing import AbstractSet, Dict, Tuple, Union
 
 __all__ = ("ModuleReloader",)
 
+_INIT_SUFFIX = os.sep + "__init__.py"
+
 
 class ModuleReloader:
-    async def reload(self, ignore_modules: Set[str]) -> None:
-        for name in list(sys.modules.keys()):
-            if name in ignore_modules:
+    def __init__(self) -> None:
+        self._cache: Dict[str, Tuple[str, int]] = {}
+
+    async def reload(self, ignore_modules: AbstractSet[str]) -> int:
+        cwd = os.getcwd() + os.sep
+        ignore = ignore_modules if isinstance(ignore_modules, frozenset) else frozenset(ignore_modules)
+
+        # the filtering pass does not touch sys.modules, so no snapshot copy is needed
+        candidates = []
+        for name, module in sys.modules.items():
+            if name in ignore:
                 continue
-            module = sys.modules[name]
-            module_path = getattr(module, "__file__", None)
-            if module_path and self._path_to_module(Path(module_path)) == name:
-                importlib.reload(module)
-
-    def _path_to_module(self, path: Path) -> Union[str, None]:
-        if path.name == "__init__.py":
-            path = path.parent
-
-        try:
-            rel_path = path.relative_to(Path.cwd())
-        except ValueError:
-            return None
+            module_path = module.__dict__.get("__file__")
+            if not module_path or not module_path.startswith(cwd):
+                continue
+            if self._path_to_module(module_path, cwd) == name:
+                candidates.append((name, module, module_path))
+
+        reloaded = 0
+        for name, module, module_path in candidates:
+            mtime = os.stat(module_path).st_mtime_ns
+            cached = self._cache.get(name)
+            if cached and (cached[0] == module_path) and (cached[1] == mtime):
+                continue
+
+            importlib.reload(module)
+            self._cache[name] = (module_path, mtime)
+            reloaded += 1
+        return reloaded
+
+    def _path_to_module(self, path: str, cwd: str) -> Union[str, None]:
+        rel_path = path[len(cwd):]
+        if rel_path.endswith(_INIT_SUFFIX):
+            rel_path = rel_path[:-len(_INIT_SUFFIX)]
+        elif rel_path.endswith(".py"):
+            rel_path = rel_path[:-len(".py")]
         else:
-            return ".".join(rel_path.with_suffix("").parts)
+            return None
+        return rel_path.replace(os.sep, ".")
@@ -1,6 +1,6 @@
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import TypedDict
 
 __all__ = ("ProtoAction", "StepStatus", "ScenarioInfo", "StepInfo",)
 
@@ -10,6 +10,7 @@ class ProtoAction(Enum):
     RUN_STEPS_BEFORE = "RUN_STEPS_BEFORE"
     RUN_STEP_NEXT = "RUN_STEP_NEXT"
     SYNC_STATE = "SYNC_STATE"
+    STEP_UPDATE = "STEP_UPDATE"
 
 
 class StepStatus(Enum):
@@ -19,13 +20,19 @@ class StepStatus(Enum):
     FAILED = "FAILED"
 
 
-class ScenarioInfo(TypedDict):
+@dataclass
+class ScenarioInfo:
+    __slots__ = ("unique_id", "subject", "rel_path")
+
     unique_id: str
     subject: str
     rel_path: Path
 
 
-class StepInfo(TypedDict):
+@dataclass
+class StepInfo:
+    __slots__ = ("index", "name", "status")
+
     index: int
     name: str
-    status: StepStatus
+    status: str
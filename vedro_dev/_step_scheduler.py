@@ -1,6 +1,7 @@
 from abc import abstractmethod
-from asyncio import Queue
-from typing import List, Union
+from asyncio import Event
+from collections import deque
+from typing import Deque, Iterator, Union
 
 from vedro.core import VirtualScenario, VirtualStep
 
@@ -23,33 +24,39 @@ class StepScheduler:
 class PlainStepScheduler(StepScheduler):
     def __init__(self, scenario: VirtualScenario) -> None:
         super().__init__(scenario)
-        self._steps: List[VirtualStep] = []
+        self._steps: Iterator[VirtualStep] = iter(())
 
     def __aiter__(self) -> "PlainStepScheduler":
-        self._steps = [step for step in self._scenario.steps]
+        self._steps = iter(self._scenario.steps)
         return self
 
     async def __anext__(self) -> VirtualStep:
-        if not self._steps:
+        try:
+            return next(self._steps)
+        except StopIteration:
             raise StopAsyncIteration()
-        return self._steps.pop(0)
 
 
 class DevStepScheduler(StepScheduler):
     def __init__(self, scenario: VirtualScenario) -> None:
         super().__init__(scenario)
-        self._queue: Queue[Union[VirtualStep, None]] = Queue()
-        for step in scenario.steps:
-            self._queue.put_nowait(step)
+        self._queue: Deque[Union[VirtualStep, None]] = deque(scenario.steps)
+        self._event = Event()
+        if self._queue:
+            self._event.set()
 
     def schedule(self, step: Union[VirtualStep, None]) -> None:
-        self._queue.put_nowait(step)
+        self._queue.append(step)
+        self._event.set()
 
     def __aiter__(self) -> "DevStepScheduler":
         return self
 
     async def __anext__(self) -> VirtualStep:
-        maybe_step = await self._queue.get()
+        while not self._queue:
+            self._event.clear()
+            await self._event.wait()
+        maybe_step = self._queue.popleft()
         if maybe_step is None:
             raise StopAsyncIteration()
         return maybe_step
@@ -1,9 +1,8 @@
 import webbrowser
-from asyncio import CancelledError
+from asyncio import CancelledError, Event, Lock, Task, create_task, sleep
 from pathlib import Path
-from typing import Dict, List, Sequence, Type, Union, cast
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Sequence, Tuple, Type, Union, cast
 
-from rich.style import Style
 from vedro.core import (
     ConfigType,
     Dispatcher,
@@ -29,16 +28,28 @@ from vedro.events import (
     StepPassedEvent,
     StepRunEvent,
 )
-from vedro.plugins.director.rich import RichPrinter
 
 from ._dev_runner import DevScenarioRunner
-from ._module_reloader import ModuleReloader
 from ._protocol import ProtoAction, ScenarioInfo, StepInfo, StepStatus
 from ._step_scheduler import DevStepScheduler
 from ._web_socket_server import MessageType, WebSocketServer
 
+if TYPE_CHECKING:
+    from rich.style import Style
+    from vedro.plugins.director.rich import RichPrinter
+
+    from ._module_reloader import ModuleReloader
+
 __all__ = ("VedroDev", "VedroDevPlugin")
 
+_ACTION_SYNC_STATE = ProtoAction.SYNC_STATE.value
+_ACTION_STEP_UPDATE = ProtoAction.STEP_UPDATE.value
+
+_STATUS_PENDING = StepStatus.PENDING.value
+_STATUS_RUNNING = StepStatus.RUNNING.value
+_STATUS_PASSED = StepStatus.PASSED.value
+_STATUS_FAILED = StepStatus.FAILED.value
+
 
 class VedroDevPlugin(Plugin):
     def __init__(self, config: Type["VedroDev"]) -> None:
@@ -49,38 +60,83 @@ class VedroDevPlugin(Plugin):
         self._app_url = config.app_url
         self._verbose = config.verbose
         self._reload_imports = config.reload_imports
-        self._reload_imports_ignore = set(config.reload_imports_ignore)
+        self._reload_imports_ignore = frozenset(config.reload_imports_ignore)
 
-        self._rich_printer = cast(RichPrinter, ...)
+        self._rich_printer = cast("RichPrinter", ...)
         self._global_config = cast(ConfigType, ...)
         self._loader = cast(ScenarioLoader, ...)
         self._discoverer = cast(ScenarioDiscoverer, ...)
-        self._module_reloader = cast(ModuleReloader, ...)
+        self._module_reloader = cast("ModuleReloader", ...)
+
+        self._style_print = cast("Style", ...)
+        self._style_debug = cast("Style", ...)
+        self._style_subject = cast("Style", ...)
 
         self._ws_server = cast(WebSocketServer, ...)
+        self._send_message = cast(Callable[[MessageType], Awaitable[None]], ...)
+        self._sync_event = cast(Event, ...)
+        self._sync_task = cast("Task[None]", ...)
+        self._reload_lock = cast(Lock, ...)
 
         self._scn_scheduler = cast(ScenarioScheduler, ...)
         self._step_scheduler = cast(DevStepScheduler, ...)
         self._scenario = cast(ScenarioInfo, ...)
         self._steps: Dict[str, StepInfo] = {}
+        self._scn_cache: Dict[Path, Tuple[int, int, List[VirtualScenario]]] = {}
+        self._steps_index: Dict[str, Dict[str, VirtualStep]] = {}
+        self._reload_version = 0
+        self._steps_payload: List[MessageType] = []
+        self._payload_by_name: Dict[str, MessageType] = {}
+        self._sync_payload: MessageType = {}
         self._step_buffer: List[VirtualStep] = []
 
-    def _set_scenario(self, scenario: VirtualScenario) -> None:
-        self._scenario = {
-            "unique_id": scenario.unique_id,
-            "subject": scenario.subject,
-            "rel_path": scenario.rel_path,
+        self._handlers: Dict[str, Callable[[MessageType], Awaitable[None]]] = {
+            ProtoAction.RUN_STEP_X.value:
+                lambda message: self._run_step_x(message["payload"]["step"]),
+            ProtoAction.RUN_STEPS_BEFORE.value:
+                lambda message: self._run_step_before(message["payload"]["step"]),
+            ProtoAction.RUN_STEP_NEXT.value:
+                lambda message: self._run_step_next(message["payload"]["step"]),
         }
 
+    def _set_scenario(self, scenario: VirtualScenario) -> None:
+        self._scenario = ScenarioInfo(
+            unique_id=scenario.unique_id,
+            subject=scenario.subject,
+            rel_path=scenario.rel_path,
+        )
+
     def _set_steps(self, steps: List[VirtualStep]) -> None:
         updated_steps: Dict[str, StepInfo] = {}
+        steps_payload: List[MessageType] = []
         for index, step in enumerate(steps):
-            updated_steps[step.name] = {
+            updated_steps[step.name] = StepInfo(
+                index=index,
+                name=step.name,
+                status=_STATUS_PENDING,
+            )
+            steps_payload.append({
                 "index": index,
                 "name": step.name,
-                "status": StepStatus.PENDING,
-            }
+                "status": _STATUS_PENDING,
+            })
         self._steps = updated_steps
+        self._steps_payload = steps_payload
+        self._payload_by_name = {payload["name"]: payload for payload in steps_payload}
+        self._sync_payload = {
+            "action": _ACTION_SYNC_STATE,
+            "version": "v2",
+            "payload": {
+                "unique_id": self._scenario.unique_id,
+                "subject": self._scenario.subject,
+                "rel_path": str(self._scenario.rel_path),
+                "steps": steps_payload,
+            },
+        }
+
+    def _set_step_status(self, step_name: str, status: str) -> None:
+        self._steps[step_name].status = status
+        self._payload_by_name[step_name]["status"] = status
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         self._dispatcher = dispatcher
@@ -108,11 +164,21 @@ class VedroDevPlugin(Plugin):
                         .listen(ScenarioFailedEvent, self.on_scenario_end) \
                         .listen(CleanupEvent, self.on_cleanup)
 
+        # deferred imports: dev-mode-only dependencies should not slow down regular runs
+        from rich.style import Style
+        from vedro.plugins.director.rich import RichPrinter
+
+        from ._module_reloader import ModuleReloader
+
         self._rich_printer = RichPrinter()
         self._loader = self._global_config.Registry.ScenarioLoader()
         self._discoverer = self._global_config.Registry.ScenarioDiscoverer()
         self._module_reloader = ModuleReloader()
 
+        self._style_print = Style(color="yellow")
+        self._style_debug = Style(color="grey50")
+        self._style_subject = Style(color="cyan")
+
         interrupt_exceptions = (KeyboardInterrupt, SystemExit, CancelledError,)
         self._global_config.Registry.ScenarioRunner.register(
             lambda: DevScenarioRunner(self._global_config.Registry.Dispatcher(),
@@ -126,11 +192,11 @@ class VedroDevPlugin(Plugin):
         return self._step_scheduler
 
     def _print(self, message: str) -> None:
-        self._rich_printer.console.out(f"# {message}", style=Style(color="yellow"))
+        self._rich_printer.console.out(f"# {message}", style=self._style_print)
 
     def _print_debug(self, message: str) -> None:
         if self._verbose:
-            self._rich_printer.console.out(f"# {message}", style=Style(color="grey50"))
+            self._rich_printer.console.out(f"# {message}", style=self._style_debug)
 
     async def _on_connect(self) -> None:
         self._print_debug("Client connected")
@@ -140,19 +206,17 @@ class VedroDevPlugin(Plugin):
         self._print_debug("Client disconnected")
 
     async def _run_step_x(self, step_name: str) -> None:
-        step = await self._reload_step(self._scenario["unique_id"], self._scenario["rel_path"], step_name)
-        self._steps[step.name]["status"] = StepStatus.PENDING
+        step = await self._reload_step(self._scenario.unique_id, self._scenario.rel_path, step_name)
+        self._set_step_status(step.name, _STATUS_PENDING)
         self._step_scheduler.schedule(step)
 
     async def _run_step_before(self, step_name: str) -> None:
-        reloaded = await self._reload_scenario(self._scenario["unique_id"], self._scenario["rel_path"])
-        steps = []
-        for step in reloaded.steps:
-            steps.append(step)
-            if step.name == step_name:
-                break
-        if len(steps) == 0:
+        reloaded = await self._reload_scenario(self._scenario.unique_id, self._scenario.rel_path)
+        # index against the freshly reloaded steps: self._steps may predate an edit
+        index = next((i for i, step in enumerate(reloaded.steps) if step.name == step_name), None)
+        if index is None:
             exit(f"Failed to find step {step_name}")
+        steps = reloaded.steps[:index + 1]
         scenario = VirtualScenario(reloaded._orig_scenario, [steps[0]])
         self._step_buffer = steps[1:]
 
@@ -166,69 +230,90 @@ class VedroDevPlugin(Plugin):
         if step_name is not None:
             return await self._run_step_x(step_name)
 
-        steps = [step for step in self._steps.values() if step["index"] == 0]
-        if len(steps) != 1:
+        # self._steps is keyed by name in index order, so the first key is the first step
+        first_step_name = next(iter(self._steps), None)
+        if first_step_name is None:
             exit("Failed to find first step")
-        return await self._run_step_before(steps[0]["name"])
+        return await self._run_step_before(first_step_name)
 
     async def _on_message(self, message: MessageType) -> None:
-        action = ProtoAction(message["action"])
-        if action == ProtoAction.RUN_STEP_X:
-            await self._run_step_x(message["payload"]["step"])
-        elif action == ProtoAction.RUN_STEPS_BEFORE:
-            await self._run_step_before(message["payload"]["step"])
-        elif action == ProtoAction.RUN_STEP_NEXT:
-            await self._run_step_next(message["payload"]["step"])
-        else:
-            exit(f"Unknown action {action}")
+        handler = self._handlers.get(message["action"])
+        if handler is None:
+            exit(f"Unknown action {message['action']}")
+        await handler(message)
+
+    def _request_sync(self) -> None:
+        self._sync_event.set()
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await self._sync_event.wait()
+            # coalesce bursts of state changes into a single broadcast
+            await sleep(0.01)
+            self._sync_event.clear()
+            await self._sync_state()
 
     async def _sync_state(self) -> None:
-        steps = []
-        for step in self._steps.values():
-            steps.append({
-                "index": step["index"],
-                "name": step["name"],
-                "status": step["status"].value,
-            })
-        await self._ws_server.send_message({
-            "action": ProtoAction.SYNC_STATE.value,
+        if not self._ws_server.has_clients():
+            return
+        await self._send_message(self._sync_payload)
+
+    async def _send_step_update(self, step_name: str, status: str) -> None:
+        if not self._ws_server.has_clients():
+            return
+        await self._send_message({
+            "action": _ACTION_STEP_UPDATE,
             "version": "v2",
             "payload": {
-                "unique_id": self._scenario["unique_id"],
-                "subject": self._scenario["subject"],
-                "rel_path": str(self._scenario["rel_path"]),
-                "steps": sorted(steps, key=lambda x: x["index"]),
+                "name": step_name,
+                "status": status,
             },
         })
 
     async def _reload_scenario(self, unique_id: str, rel_path: Path) -> VirtualScenario:
         if self._reload_imports:
-            await self._module_reloader.reload(self._reload_imports_ignore)
-
-        loaded = await self._loader.load(rel_path)
-        scenarios = [create_vscenario(scn) for scn in loaded]
-
-        candidates = [scn for scn in scenarios if scn.unique_id == unique_id]
-        if len(candidates) < 1:
+            reloaded_count = await self._module_reloader.reload(self._reload_imports_ignore)
+            if reloaded_count > 0:
+                # reloaded imports may change scenario behavior, so cached scenarios are stale
+                self._reload_version += 1
+
+        async with self._reload_lock:
+            mtime = rel_path.stat().st_mtime_ns
+            cached = self._scn_cache.get(rel_path)
+            if cached and (cached[0] == mtime) and (cached[1] == self._reload_version):
+                scenarios = cached[2]
+            else:
+                loaded = await self._loader.load(rel_path)
+                scenarios = [create_vscenario(scn) for scn in loaded]
+                self._scn_cache[rel_path] = (mtime, self._reload_version, scenarios)
+                self._steps_index.clear()
+
+        scn_by_id = {scn.unique_id: scn for scn in scenarios}
+        scenario = scn_by_id.get(unique_id)
+        if scenario is None:
             exit(f"Failed to find scenario {rel_path}")
-        return candidates[0]
+        return scenario
 
     async def _reload_step(self, unique_id: str, rel_path: Path, step_name: str) -> VirtualStep:
         scenario = await self._reload_scenario(unique_id, rel_path)
 
-        candidates = [step for step in scenario.steps if step.name == step_name]
-        if len(candidates) < 1:
+        step_by_name = self._steps_index.get(unique_id)
+        if step_by_name is None:
+            step_by_name = {step.name: step for step in scenario.steps}
+            self._steps_index[unique_id] = step_by_name
+        step = step_by_name.get(step_name)
+        if step is None:
             exit(f"Failed to find step {step_name}")
-        return candidates[0]
+        return step
 
     async def on_startup(self, event: StartupEvent) -> None:
         self._scn_scheduler = event.scheduler
 
-        scheduled_scenarios = list(self._scn_scheduler.scheduled)
-        if len(scheduled_scenarios) != 1:
+        scheduled_scenarios = iter(self._scn_scheduler.scheduled)
+        scheduled = next(scheduled_scenarios, None)
+        if (scheduled is None) or (next(scheduled_scenarios, None) is not None):
             exit("Only one scenario can be scheduled in dev mode")
 
-        scheduled = scheduled_scenarios[0]
         scenario = VirtualScenario(scheduled._orig_scenario, [])
         self._set_scenario(scenario)
         self._set_steps(scheduled.steps)
@@ -241,6 +326,11 @@ class VedroDevPlugin(Plugin):
                                           on_disconnect=self._on_disconnect,
                                           on_message=self._on_message)
         await self._ws_server.start()
+        self._send_message = self._ws_server.send_message
+
+        self._sync_event = Event()
+        self._sync_task = create_task(self._sync_loop())
+        self._reload_lock = Lock()
 
         self._print(f"Server is now running at {self._host}:{self._port}")
         self._print(f"Open client at {self._app_url} to continue")
@@ -252,11 +342,12 @@ class VedroDevPlugin(Plugin):
     async def on_scenario_run(self, event: ScenarioRunEvent) -> None:
         scenario_result = event.scenario_result
         self._rich_printer.console.out(f" ➜ {scenario_result.scenario.subject}",
-                                       style=Style(color="cyan"))
+                                       style=self._style_subject)
+        self._request_sync()
 
     async def on_step_run(self, event: StepRunEvent) -> None:
-        self._steps[event.step_result.step_name]["status"] = StepStatus.RUNNING
-        await self._sync_state()
+        self._set_step_status(event.step_result.step_name, _STATUS_RUNNING)
+        await self._send_step_update(event.step_result.step_name, _STATUS_RUNNING)
 
     async def on_step_end(self, event: Union[StepPassedEvent, StepFailedEvent]) -> None:
         step_result = event.step_result
@@ -266,20 +357,25 @@ class VedroDevPlugin(Plugin):
             self._rich_printer.print_exception(step_result.exc_info)
 
         if isinstance(event, StepFailedEvent):
-            status = StepStatus.FAILED
+            status = _STATUS_FAILED
             self._step_buffer.clear()
         else:
-            status = StepStatus.PASSED
+            status = _STATUS_PASSED
             if self._step_buffer:
                 self._step_scheduler.schedule(self._step_buffer.pop(0))
 
-        self._steps[step_result.step_name]["status"] = status
-        await self._sync_state()
+        self._set_step_status(step_result.step_name, status)
+        await self._send_step_update(step_result.step_name, status)
 
     async def on_scenario_end(self, event: Union[ScenarioPassedEvent, ScenarioFailedEvent]) -> None:
         pass
 
     async def on_cleanup(self, event: CleanupEvent) -> None:
+        self._sync_task.cancel()
+        try:
+            await self._sync_task
+        except CancelledError:
+            pass
         await self._ws_server.stop()
         self._print_debug("Server stopped")
 
@@ -1,6 +1,5 @@
-from json import loads
+from asyncio import gather
 from typing import Any, Awaitable, Callable, Dict, Optional
-from weakref import WeakSet
 
 from aiohttp.web import Application, AppRunner, Request, TCPSite, WebSocketResponse
 
@@ -8,6 +7,19 @@ __all__ = ("WebSocketServer", "MessageType",)
 
 MessageType = Dict[str, Any]
 
+try:
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _loads
+
+    def _dumps(message: Any) -> str:
+        return _orjson_dumps(message, default=str).decode()
+except ImportError:
+    from json import dumps as _json_dumps
+    from json import loads as _loads  # type: ignore[assignment]
+
+    def _dumps(message: Any) -> str:
+        return _json_dumps(message, default=str)
+
 
 class WebSocketServer:
     def __init__(self, host: str = "localhost", port: int = 8084, *,
@@ -21,13 +33,16 @@ class WebSocketServer:
         self._app.router.add_get("/ws", self._handler)
         self._runner = AppRunner(self._app, handle_signals=False)
 
-        self._app["websockets"] = WeakSet()
+        # _handler owns the socket lifecycle (add on prepare, discard in finally),
+        # so a plain set suffices — no weakref per connection
+        self._app["websockets"] = set()
         self._on_connect = on_connect
         self._on_disconnect = on_disconnect
         self._on_message = on_message
 
     async def _handler(self, request: Request) -> WebSocketResponse:
-        ws = WebSocketResponse()
+        # deflate is pure CPU overhead for small JSON frames on a local connection
+        ws = WebSocketResponse(compress=False, heartbeat=30)
         await ws.prepare(request)
         request.app["websockets"].add(ws)
         if self._on_connect:
@@ -36,7 +51,7 @@ class WebSocketServer:
         try:
             async for msg in ws:
                 if self._on_message:
-                    await self._on_message(loads(msg.data))
+                    await self._on_message(_loads(msg.data))
         finally:
             request.app["websockets"].discard(ws)
             if self._on_disconnect:
@@ -44,9 +59,14 @@ class WebSocketServer:
 
         return ws
 
+    def has_clients(self) -> bool:
+        return len(self._app["websockets"]) > 0
+
     async def send_message(self, message: Any) -> None:
-        for ws in self._app["websockets"]:
-            await ws.send_json(message)
+        payload = _dumps(message)
+        # snapshot the registry: handlers may add/discard sockets while the sends run
+        sockets = list(self._app["websockets"])
+        await gather(*(ws.send_str(payload) for ws in sockets), return_exceptions=True)
 
     async def start(self) -> None:
         await self._runner.setup()